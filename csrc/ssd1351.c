@@ -0,0 +1,130 @@
+#include "zerynth.h"
+
+/*
+ * Hot paths of the ssd1351 driver.
+ * Colors are 65k RGB565 and are stored in the display buffers big endian.
+ */
+
+C_NATIVE(_ssd1351_encode_color) {
+    NATIVE_UNWARN();
+    int32_t color;
+
+    if (parse_py_args("i", nargs, args, &color) != 1)
+        return ERR_TYPE_EXC;
+    /* keep the 5-6-5 most significant bits of each channel */
+    *res = PSMALLINT_NEW(((color >> 8) & 0xF800) | ((color >> 5) & 0x07E0) | ((color >> 3) & 0x001F));
+    return ERR_OK;
+}
+
+C_NATIVE(_ssd1351_fill_buf) {
+    NATIVE_UNWARN();
+    uint8_t *buf;
+    int32_t len;
+    int32_t offset;
+    int32_t count;
+    int32_t color;
+    uint8_t hi, lo;
+
+    if (parse_py_args("siii", nargs, args, &buf, &len, &offset, &count, &color) != 4)
+        return ERR_TYPE_EXC;
+    if (offset < 0 || count < 0 || offset + count * 2 > len)
+        return ERR_INDEX_EXC;
+    hi = (color >> 8) & 0xFF;
+    lo = color & 0xFF;
+    buf += offset;
+    while (count--) {
+        *buf++ = hi;
+        *buf++ = lo;
+    }
+    *res = MAKE_NONE();
+    return ERR_OK;
+}
+
+/*
+ * Bitmap glyph: each row takes (width+7)/8 font bytes, bit 0 is the leftmost pixel.
+ */
+C_NATIVE(_ssd1351_glyph_bits) {
+    NATIVE_UNWARN();
+    uint8_t *buf;
+    int32_t len;
+    uint8_t *font;
+    int32_t font_len;
+    int32_t offset;
+    int32_t width;
+    int32_t height;
+    int32_t fg;
+    int32_t bg;
+    int32_t r, col;
+    uint8_t bits;
+    uint8_t fg_hi, fg_lo, bg_hi, bg_lo;
+
+    if (parse_py_args("ssiiiii", nargs, args, &buf, &len, &font, &font_len, &offset, &width, &height, &fg, &bg) != 7)
+        return ERR_TYPE_EXC;
+    if (offset < 0 || width < 0 || height < 0 || width * height * 2 > len
+            || offset + ((width + 7) >> 3) * height > font_len)
+        return ERR_INDEX_EXC;
+    fg_hi = (fg >> 8) & 0xFF;
+    fg_lo = fg & 0xFF;
+    bg_hi = (bg >> 8) & 0xFF;
+    bg_lo = bg & 0xFF;
+    font += offset;
+    for (r = 0; r < height; r++) {
+        bits = 0;
+        for (col = 0; col < width; col++) {
+            if (!(col & 7))
+                bits = *font++;
+            if (bits & 1) {
+                *buf++ = fg_hi;
+                *buf++ = fg_lo;
+            } else {
+                *buf++ = bg_hi;
+                *buf++ = bg_lo;
+            }
+            bits >>= 1;
+        }
+    }
+    *res = MAKE_NONE();
+    return ERR_OK;
+}
+
+/*
+ * Run-length encoded glyph: a single stream of bytes, high nibble is the length of a run of
+ * font color pixels, low nibble the length of the background run that follows (see tools/rle_font.py).
+ */
+C_NATIVE(_ssd1351_glyph_rle) {
+    NATIVE_UNWARN();
+    uint8_t *buf;
+    int32_t len;
+    uint8_t *font;
+    int32_t font_len;
+    int32_t offset;
+    int32_t count;
+    int32_t fg;
+    int32_t bg;
+    uint8_t run, n;
+    uint8_t fg_hi, fg_lo, bg_hi, bg_lo;
+
+    if (parse_py_args("ssiiii", nargs, args, &buf, &len, &font, &font_len, &offset, &count, &fg, &bg) != 6)
+        return ERR_TYPE_EXC;
+    if (offset < 0 || count < 0 || count * 2 > len)
+        return ERR_INDEX_EXC;
+    fg_hi = (fg >> 8) & 0xFF;
+    fg_lo = fg & 0xFF;
+    bg_hi = (bg >> 8) & 0xFF;
+    bg_lo = bg & 0xFF;
+    while (count > 0) {
+        if (offset >= font_len)
+            return ERR_INDEX_EXC;
+        run = font[offset++];
+        for (n = run >> 4; n && count > 0; n--, count--) {
+            *buf++ = fg_hi;
+            *buf++ = fg_lo;
+        }
+        for (n = run & 0x0F; n && count > 0; n--, count--) {
+            *buf++ = bg_hi;
+            *buf++ = bg_lo;
+        }
+    }
+    *res = MAKE_NONE();
+    return ERR_OK;
+}
@@ -20,19 +20,25 @@ try:
     # Setup display 
     # This setup is referred to ssd1351 mounted on Hexiwear device 
     ssd = ssd1351.SSD1351(SPI0,D57,D58,D59,D71)
-    ssd.init(96,96)
+    # buffered mode: draw in RAM, then send the whole screen on swap() or only the changed tiles on flush()
+    ssd.init(96,96,buffered=True)
     ssd.on()
 except Exception as e:
     print("Error1", e)
 
 while True:
     ssd.fill_screen(color=0xFFFF00)
+    ssd.swap()
     sleep(1000)
     ssd.draw_text("Hello Zerynth",0,0,96,24, color=0xFFFF, align=3, background=0x4471, encode=False)
+    ssd.flush()
     sleep(1000)
     ssd.draw_text("Hello Zerynth",0,24,96,24, color=0x4471, align=1, background=0xFFFF, encode=False)
+    ssd.flush()
     sleep(1000)
     ssd.draw_text("Hello Zerynth",0,48,96,24, color=0x4471, align=2, background=0x0000, encode=False)
+    ssd.flush()
     sleep(1000)
     ssd.draw_text("Hello Zerynth",0,72,96,24, color=0x0000, align=3, background=0x4471, encode=False)
+    ssd.flush()
     sleep(1000)
\ No newline at end of file
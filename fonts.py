@@ -198,3 +198,204 @@ guiFont_Tahoma_7_Regular = [
    0x00,0x00,0x00,0x00,0x00,0x26,0x19,0x00,0x00,0x00,0x00,                          # Code for char num 126
    0x00,0x00,0x00,0x03,0x03,0x03,0x03,0x03,0x00,0x00,0x00
 ]
+
+guiFont_Tahoma_7_Regular_RLE = [
+   0x01,
+   0x00,
+   0x20,0x00,
+   0x7F,0x00,
+   0x0B,
+   0x10,
+   0x03,0x88,0x01,0x00,
+   0x01,0x8B,0x01,0x00,
+   0x03,0x8E,0x01,0x00,
+   0x07,0x94,0x01,0x00,
+   0x05,0xA3,0x01,0x00,
+   0x09,0xAD,0x01,0x00,
+   0x06,0xC3,0x01,0x00,
+   0x01,0xD1,0x01,0x00,
+   0x03,0xD3,0x01,0x00,
+   0x02,0xDE,0x01,0x00,
+   0x05,0xE6,0x01,0x00,
+   0x06,0xF2,0x01,0x00,
+   0x02,0xFA,0x01,0x00,
+   0x02,0xFD,0x01,0x00,
+   0x02,0xFF,0x01,0x00,
+   0x03,0x02,0x02,0x00,
+   0x04,0x0C,0x02,0x00,
+   0x04,0x15,0x02,0x00,
+   0x04,0x1D,0x02,0x00,
+   0x04,0x25,0x02,0x00,
+   0x05,0x2C,0x02,0x00,
+   0x04,0x36,0x02,0x00,
+   0x04,0x3C,0x02,0x00,
+   0x04,0x45,0x02,0x00,
+   0x04,0x4D,0x02,0x00,
+   0x04,0x57,0x02,0x00,
+   0x02,0x60,0x02,0x00,
+   0x02,0x65,0x02,0x00,
+   0x06,0x6A,0x02,0x00,
+   0x06,0x71,0x02,0x00,
+   0x06,0x76,0x02,0x00,
+   0x04,0x7E,0x02,0x00,
+   0x07,0x85,0x02,0x00,
+   0x06,0x96,0x02,0x00,
+   0x05,0xA0,0x02,0x00,
+   0x06,0xAA,0x02,0x00,
+   0x06,0xB3,0x02,0x00,
+   0x05,0xBD,0x02,0x00,
+   0x05,0xC4,0x02,0x00,
+   0x06,0xCB,0x02,0x00,
+   0x06,0xD5,0x02,0x00,
+   0x03,0xDD,0x02,0x00,
+   0x03,0xE5,0x02,0x00,
+   0x05,0xEC,0x02,0x00,
+   0x04,0xF9,0x02,0x00,
+   0x07,0x01,0x03,0x00,
+   0x06,0x10,0x03,0x00,
+   0x07,0x1B,0x03,0x00,
+   0x05,0x28,0x03,0x00,
+   0x07,0x30,0x03,0x00,
+   0x05,0x3E,0x03,0x00,
+   0x05,0x49,0x03,0x00,
+   0x05,0x4F,0x03,0x00,
+   0x06,0x57,0x03,0x00,
+   0x06,0x60,0x03,0x00,
+   0x07,0x6B,0x03,0x00,
+   0x04,0x7E,0x03,0x00,
+   0x05,0x88,0x03,0x00,
+   0x04,0x93,0x03,0x00,
+   0x02,0x9B,0x03,0x00,
+   0x03,0xA5,0x03,0x00,
+   0x02,0xAF,0x03,0x00,
+   0x05,0xB9,0x03,0x00,
+   0x05,0xC0,0x03,0x00,
+   0x03,0xC5,0x03,0x00,
+   0x04,0xC9,0x03,0x00,
+   0x04,0xD0,0x03,0x00,
+   0x03,0xD9,0x03,0x00,
+   0x04,0xDE,0x03,0x00,
+   0x04,0xE7,0x03,0x00,
+   0x03,0xED,0x03,0x00,
+   0x04,0xF4,0x03,0x00,
+   0x04,0xFD,0x03,0x00,
+   0x01,0x07,0x04,0x00,
+   0x02,0x0A,0x04,0x00,
+   0x04,0x12,0x04,0x00,
+   0x01,0x1E,0x04,0x00,
+   0x07,0x20,0x04,0x00,
+   0x04,0x2D,0x04,0x00,
+   0x04,0x35,0x04,0x00,
+   0x04,0x3D,0x04,0x00,
+   0x04,0x46,0x04,0x00,
+   0x03,0x4F,0x04,0x00,
+   0x03,0x55,0x04,0x00,
+   0x02,0x59,0x04,0x00,
+   0x04,0x5F,0x04,0x00,
+   0x05,0x67,0x04,0x00,
+   0x07,0x72,0x04,0x00,
+   0x03,0x80,0x04,0x00,
+   0x05,0x88,0x04,0x00,
+   0x03,0x95,0x04,0x00,
+   0x03,0x9B,0x04,0x00,
+   0x02,0xA6,0x04,0x00,
+   0x03,0xB1,0x04,0x00,
+   0x06,0xBC,0x04,0x00,
+   0x02,0xC3,0x04,0x00,
+   0x0F,0x0F,0x03,                                                                  # Code for char num 32
+   0x02,0x51,0x12,                                                                  # Code for char num 33
+   0x03,0x11,0x21,0x21,0x1F,0x06,                                                   # Code for char num 34
+   0x0F,0x01,0x12,0x13,0x12,0x12,0x62,0x11,0x12,0x62,0x12,0x13,0x12,0x1F,0x01,      # Code for char num 35
+   0x0C,0x13,0x51,0x13,0x24,0x23,0x11,0x53,0x14,0x12,                               # Code for char num 36
+   0x0F,0x04,0x23,0x12,0x12,0x11,0x13,0x12,0x11,0x14,0x21,0x11,0x24,0x11,0x12,0x13,0x11,0x12,0x12,0x13,0x2F,0x04,# Code for char num 37
+   0x0D,0x23,0x12,0x12,0x12,0x13,0x21,0x11,0x12,0x12,0x12,0x22,0x22,0x1C,           # Code for char num 38
+   0x01,0x37,                                                                       # Code for char num 39
+   0x05,0x11,0x11,0x12,0x12,0x12,0x12,0x12,0x13,0x13,0x10,                          # Code for char num 40
+   0x04,0x12,0x11,0x11,0x11,0x11,0x11,0x23,                                         # Code for char num 41
+   0x02,0x12,0x11,0x11,0x11,0x31,0x11,0x11,0x12,0x1F,0x0F,0x02,                     # Code for char num 42
+   0x0F,0x06,0x15,0x13,0x53,0x15,0x1F,0x05,                                         # Code for char num 43
+   0x0F,0x11,0x23,                                                                  # Code for char num 44
+   0x0C,0x28,                                                                       # Code for char num 45
+   0x0F,0x11,0x14,                                                                  # Code for char num 46
+   0x05,0x12,0x11,0x12,0x12,0x12,0x12,0x11,0x12,0x15,                               # Code for char num 47
+   0x09,0x21,0x12,0x22,0x22,0x22,0x22,0x11,0x29,                                    # Code for char num 48
+   0x0A,0x12,0x23,0x13,0x13,0x13,0x12,0x38,                                         # Code for char num 49
+   0x08,0x34,0x13,0x12,0x12,0x12,0x13,0x48,                                         # Code for char num 50
+   0x08,0x34,0x13,0x11,0x24,0x13,0x49,                                              # Code for char num 51
+   0x0D,0x13,0x22,0x11,0x11,0x12,0x11,0x53,0x14,0x1B,                               # Code for char num 52
+   0x08,0x53,0x13,0x34,0x13,0x49,                                                   # Code for char num 53
+   0x09,0x21,0x13,0x13,0x31,0x12,0x22,0x11,0x29,                                    # Code for char num 54
+   0x08,0x43,0x12,0x13,0x12,0x13,0x12,0x1B,                                         # Code for char num 55
+   0x09,0x21,0x12,0x22,0x11,0x21,0x12,0x22,0x11,0x29,                               # Code for char num 56
+   0x09,0x21,0x12,0x22,0x11,0x33,0x13,0x11,0x29,                                    # Code for char num 57
+   0x09,0x11,0x13,0x11,0x14,                                                        # Code for char num 58
+   0x09,0x11,0x13,0x11,0x23,                                                        # Code for char num 59
+   0x0F,0x0E,0x12,0x32,0x16,0x36,0x1C,                                              # Code for char num 60
+   0x0F,0x0F,0x66,0x6F,0x03,                                                        # Code for char num 61
+   0x0F,0x0A,0x16,0x36,0x12,0x32,0x1F,0x01,                                         # Code for char num 62
+   0x08,0x34,0x13,0x12,0x12,0x17,0x1A,                                              # Code for char num 63
+   0x0F,0x01,0x33,0x13,0x11,0x12,0x21,0x21,0x11,0x11,0x21,0x11,0x11,0x22,0x32,0x17,0x39,# Code for char num 64
+   0x0E,0x24,0x23,0x12,0x12,0x12,0x11,0x74,0x24,0x1C,                               # Code for char num 65
+   0x0A,0x32,0x12,0x11,0x12,0x11,0x41,0x13,0x23,0x5B,                               # Code for char num 66
+   0x0E,0x32,0x13,0x25,0x15,0x16,0x13,0x12,0x3D,                                    # Code for char num 67
+   0x0C,0x42,0x13,0x11,0x14,0x24,0x24,0x23,0x11,0x4E,                               # Code for char num 68
+   0x0A,0x64,0x14,0x41,0x14,0x14,0x5A,                                              # Code for char num 69
+   0x0A,0x64,0x14,0x41,0x14,0x14,0x1E,                                              # Code for char num 70
+   0x0E,0x32,0x13,0x25,0x12,0x44,0x11,0x13,0x12,0x4C,                               # Code for char num 71
+   0x0C,0x14,0x24,0x24,0x84,0x24,0x24,0x1C,                                         # Code for char num 72
+   0x06,0x31,0x12,0x12,0x12,0x12,0x11,0x36,                                         # Code for char num 73
+   0x07,0x22,0x12,0x12,0x12,0x12,0x37,                                              # Code for char num 74
+   0x0A,0x13,0x22,0x11,0x11,0x12,0x23,0x11,0x12,0x12,0x11,0x13,0x1A,                # Code for char num 75
+   0x08,0x13,0x13,0x13,0x13,0x13,0x13,0x48,                                         # Code for char num 76
+   0x0E,0x23,0x43,0x31,0x11,0x11,0x21,0x11,0x11,0x22,0x12,0x22,0x12,0x25,0x1E,      # Code for char num 77
+   0x0C,0x14,0x33,0x21,0x12,0x22,0x11,0x23,0x34,0x24,0x1C,                          # Code for char num 78
+   0x0F,0x01,0x33,0x13,0x11,0x15,0x25,0x25,0x11,0x13,0x13,0x3F,0x01,                # Code for char num 79
+   0x0A,0x41,0x13,0x23,0x23,0x51,0x14,0x1E,                                         # Code for char num 80
+   0x0F,0x01,0x33,0x13,0x11,0x15,0x25,0x25,0x11,0x13,0x13,0x36,0x17,0x20,           # Code for char num 81
+   0x0A,0x41,0x13,0x23,0x51,0x11,0x12,0x12,0x11,0x13,0x1A,                          # Code for char num 82
+   0x0B,0x54,0x15,0x35,0x14,0x5B,                                                   # Code for char num 83
+   0x0A,0x52,0x14,0x14,0x14,0x14,0x14,0x1C,                                         # Code for char num 84
+   0x0C,0x14,0x24,0x24,0x24,0x24,0x24,0x11,0x4D,                                    # Code for char num 85
+   0x0C,0x14,0x24,0x24,0x11,0x12,0x12,0x12,0x13,0x24,0x2E,                          # Code for char num 86
+   0x0E,0x12,0x12,0x22,0x12,0x21,0x11,0x11,0x21,0x11,0x11,0x21,0x11,0x11,0x11,0x13,0x12,0x13,0x1F,# Code for char num 87
+   0x08,0x12,0x22,0x11,0x22,0x22,0x21,0x12,0x22,0x18,                               # Code for char num 88
+   0x0A,0x13,0x11,0x11,0x12,0x11,0x13,0x14,0x14,0x14,0x1C,                          # Code for char num 89
+   0x08,0x43,0x12,0x12,0x13,0x12,0x13,0x48,                                         # Code for char num 90
+   0x02,0x31,0x11,0x11,0x11,0x11,0x11,0x11,0x11,0x20,                               # Code for char num 91
+   0x03,0x12,0x13,0x12,0x12,0x12,0x12,0x13,0x12,0x13,                               # Code for char num 92
+   0x02,0x21,0x11,0x11,0x11,0x11,0x11,0x11,0x11,0x30,                               # Code for char num 93
+   0x0C,0x13,0x11,0x11,0x13,0x1F,0x0F,                                              # Code for char num 94
+   0x0F,0x0F,0x0F,0x05,0x50,                                                        # Code for char num 95
+   0x04,0x13,0x1F,0x09,                                                             # Code for char num 96
+   0x0F,0x02,0x24,0x11,0x42,0x11,0x38,                                              # Code for char num 97
+   0x04,0x13,0x13,0x13,0x31,0x12,0x22,0x22,0x49,                                    # Code for char num 98
+   0x0D,0x32,0x12,0x13,0x26,                                                        # Code for char num 99
+   0x07,0x13,0x13,0x11,0x42,0x22,0x22,0x11,0x38,                                    # Code for char num 100
+   0x0F,0x02,0x21,0x12,0x64,0x38,                                                   # Code for char num 101
+   0x04,0x32,0x12,0x42,0x12,0x12,0x18,                                              # Code for char num 102
+   0x0F,0x02,0x42,0x22,0x22,0x11,0x33,0x11,0x21,                                    # Code for char num 103
+   0x04,0x13,0x13,0x13,0x31,0x12,0x22,0x22,0x22,0x18,                               # Code for char num 104
+   0x02,0x11,0x52,                                                                  # Code for char num 105
+   0x05,0x12,0x21,0x11,0x11,0x11,0x11,0x21,                                         # Code for char num 106
+   0x04,0x13,0x13,0x13,0x12,0x21,0x11,0x22,0x11,0x11,0x12,0x18,                     # Code for char num 107
+   0x01,0x82,                                                                       # Code for char num 108
+   0x0F,0x0D,0x31,0x21,0x12,0x12,0x22,0x12,0x22,0x12,0x22,0x12,0x1E,                # Code for char num 109
+   0x0F,0x01,0x31,0x12,0x22,0x22,0x22,0x18,                                         # Code for char num 110
+   0x0F,0x02,0x21,0x12,0x22,0x22,0x11,0x29,                                         # Code for char num 111
+   0x0F,0x01,0x31,0x12,0x22,0x22,0x41,0x13,0x13,                                    # Code for char num 112
+   0x0F,0x02,0x42,0x22,0x22,0x11,0x33,0x13,0x10,                                    # Code for char num 113
+   0x0C,0x11,0x31,0x12,0x12,0x18,                                                   # Code for char num 114
+   0x0C,0x43,0x13,0x46,                                                             # Code for char num 115
+   0x06,0x11,0x31,0x11,0x12,0x14,                                                   # Code for char num 116
+   0x0F,0x01,0x12,0x22,0x22,0x22,0x11,0x38,                                         # Code for char num 117
+   0x0F,0x05,0x13,0x11,0x11,0x12,0x11,0x12,0x11,0x13,0x1C,                          # Code for char num 118
+   0x0F,0x0D,0x12,0x12,0x22,0x12,0x21,0x11,0x11,0x11,0x21,0x22,0x13,0x1F,           # Code for char num 119
+   0x0C,0x11,0x11,0x12,0x12,0x11,0x11,0x16,                                         # Code for char num 120
+   0x0F,0x05,0x13,0x11,0x11,0x12,0x11,0x12,0x11,0x13,0x14,0x13,0x13,                # Code for char num 121
+   0x0C,0x32,0x11,0x11,0x12,0x36,                                                   # Code for char num 122
+   0x05,0x11,0x12,0x12,0x12,0x11,0x13,0x12,0x12,0x13,0x10,                          # Code for char num 123
+   0x03,0x11,0x11,0x11,0x11,0x11,0x11,0x11,0x11,0x11,0x10,                          # Code for char num 124
+   0x03,0x13,0x12,0x12,0x12,0x13,0x11,0x12,0x12,0x11,0x12,                          # Code for char num 125
+   0x0F,0x0F,0x01,0x22,0x22,0x2F,0x0A,                                              # Code for char num 126
+   0x06,0xA6                                                                        # Code for char num 127
+]
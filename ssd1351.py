@@ -54,6 +54,16 @@ VERTICAL_AND_LEFT_HORIZONTAL_SCROLL     = 0x2A
 DELAYS_HWFILL = 3
 DELAYS_HWLINE = 1
 
+# side in pixels of the square tiles tracked by the buffered mode
+TILE_SIZE = 16
+# bytes of the buffer streamed by fill_rect and used by flush to gather a tile
+CHUNK_SIZE = TILE_SIZE*TILE_SIZE*2
+# largest single write of pixel data, bigger buffers are sent in more writes in the same session
+WRITE_SIZE = 4096
+
+# first header byte of run-length encoded fonts (see tools/rle_font.py)
+FONT_RLE = 0x01
+
 # SSD1351 Commands
 CMD_SETCOLUMN          = 0x15
 CMD_SETROW             = 0x75
@@ -108,6 +118,30 @@ OLED_TEXT_ALIGN = [
     OLED_TEXT_VALIGN_CENTER
 ]
 
+# x of the text inside the text box, in halves of the free space; other alignments are centered
+OLED_TEXT_ALIGN_X = {
+    OLED_TEXT_ALIGN_NONE:   0,
+    OLED_TEXT_ALIGN_LEFT:   0,
+    OLED_TEXT_ALIGN_RIGHT:  2,
+    OLED_TEXT_ALIGN_CENTER: 1
+}
+
+@c_native("_ssd1351_encode_color", ["csrc/ssd1351.c"], [])
+def _native_encode_color(color):
+    pass
+
+@c_native("_ssd1351_fill_buf", ["csrc/ssd1351.c"], [])
+def _native_fill_buf(buf, offset, count, color):
+    pass
+
+@c_native("_ssd1351_glyph_bits", ["csrc/ssd1351.c"], [])
+def _native_glyph_bits(buf, font, offset, width, height, fg, bg):
+    pass
+
+@c_native("_ssd1351_glyph_rle", ["csrc/ssd1351.c"], [])
+def _native_glyph_rle(buf, font, offset, count, fg, bg):
+    pass
+
 class SSD1351(spi.Spi):
     """
 .. class: SSD1351(drv, cs, rst, dc, pwr, clock=8000000):
@@ -138,13 +172,14 @@ class SSD1351(spi.Spi):
         self.rst=rst
         self.pwr=pwr
         self.font_init = False
-        self.dynamic_area = {
-            "x": 0,
-            "y": 0,
-            "width": 0,
-            "height": 0,
-            "buffer": None
-        }
+        # text box being drawn: position, size, offset and row stride in the buffer
+        self._da_x = 0
+        self._da_y = 0
+        self._da_w = 0
+        self._da_h = 0
+        self._da_offset = 0
+        self._da_stride = 0
+        self._da_buf = None
         pinMode(self.dc,OUTPUT)
         pinMode(self.rst,OUTPUT)
         pinMode(self.pwr,OUTPUT)
@@ -152,8 +187,14 @@ class SSD1351(spi.Spi):
         self._reset()
         self._pwr_on()
         self.buf = bytearray(1)
-        self.s_buf = None
+        self._px_buf = bytearray(2)
+        self._win_buf = bytearray(2)
+        self._fb = None
+        self._buffered = False
+        self._dirty_mask = None
+        self._chunk_buf = bytearray(CHUNK_SIZE)
         self.c_buf = None
+        self._char_width_cache = {}
     
     def _pwr_on(self):
         digitalWrite(self.pwr,1)
@@ -176,22 +217,30 @@ class SSD1351(spi.Spi):
         self.write(self.buf)
         self.unselect()
         
-    def _data(self,data):
+    def _cmd_data(self,cmd,data):
+        # command and its parameters in a single chip select session
         self.select()
-        digitalWrite(self.dc,1)
-        self.buf[0]=data
+        digitalWrite(self.dc,0)
+        self.buf[0]=cmd
         self.write(self.buf)
+        digitalWrite(self.dc,1)
+        self.write(bytes(data))
         self.unselect()
     
-    def init(self, screen_width=128, screen_height=128):
+    def init(self, screen_width=128, screen_height=128, buffered=False):
         """
 
-.. method:: init(screen_width=128, screen_height=128)
+.. method:: init(screen_width=128, screen_height=128, buffered=False)
 
         Initialize the SSD1351 setting all internal registers and the display dimensions in pixels.
 
         :param screen_width: width in pixels of the display (max 128); default 128
         :param screen_height: height in pixels of the display (max 128); default 128
+        :param buffered(*bool*): flag for enabling the buffered mode; default False
+
+        .. note:: In buffered mode all the drawing methods only update a framebuffer kept in RAM, marking the
+                  changed 16x16 pixels tiles as dirty: nothing is sent to the display until :meth:`flush`
+                  (changed tiles only) or :meth:`swap` (whole screen) is called.
         
         """
         if screen_width > 128 or screen_height > 128:
@@ -200,45 +249,35 @@ class SSD1351(spi.Spi):
         self._screen_height = screen_height
         self._column_offset = (128-screen_width)>>1
         self._raw_offset = 0
+        self._prepare = self._make_prepare()
         self._bit_per_pixel = 2
-        self._command(CMD_COMMANDLOCK)
-        self._data(0x12) # Unlock OLED driver IC MCU interface from entering command
-        self._command(CMD_COMMANDLOCK)
-        self._data(0xB1) # Command A2,B1,B3,BB,BE,C1 accessible if in unlock state 
+        self._buffered = buffered
+        if buffered:
+            # the content of the whole screen
+            self._fb = bytearray(self._screen_width*self._screen_height*self._bit_per_pixel)
+            self._tiles_x = (self._screen_width + TILE_SIZE - 1)//TILE_SIZE
+            self._tiles_y = (self._screen_height + TILE_SIZE - 1)//TILE_SIZE
+            self._dirty_mask = bytearray(self._tiles_x*self._tiles_y)
+        else:
+            # scratch area for the text box, allocated by the first draw_text
+            self._fb = None
+        self._cmd_data(CMD_COMMANDLOCK, [0x12]) # Unlock OLED driver IC MCU interface from entering command
+        self._cmd_data(CMD_COMMANDLOCK, [0xB1]) # Command A2,B1,B3,BB,BE,C1 accessible if in unlock state 
         self._command(CMD_DISPLAYOFF)
-        self._command(CMD_CLOCKDIV)
-        self._data(0xF1) # 7:4 = Oscillator Frequency, 3:0 = CLK Div Ratio (A[3:0]+1 = 1..16)
-        self._command(CMD_MUXRATIO)
-        self._data(self._screen_width-1)
-        self._command(CMD_SETREMAP)
-        self._data(self._screen_width)
-        self._command(CMD_SETCOLUMN)
-        self._data(0x00)
-        self._data(self._screen_width-1)
-        self._command(CMD_SETROW)
-        self._data(0x00)
-        self._data(self._screen_height-1)
-        self._command(CMD_STARTLINE)
-        self._data(0x80)
-        self._command(CMD_DISPLAYOFFSET)
-        self._data(self._screen_width)
-        self._command(CMD_PRECHARGE)
-        self._data(0x32)
-        self._command(CMD_VCOMH)
-        self._data(0x05)
+        self._cmd_data(CMD_CLOCKDIV, [0xF1]) # 7:4 = Oscillator Frequency, 3:0 = CLK Div Ratio (A[3:0]+1 = 1..16)
+        self._cmd_data(CMD_MUXRATIO, [self._screen_width-1])
+        self._cmd_data(CMD_SETREMAP, [self._screen_width])
+        self._cmd_data(CMD_SETCOLUMN, [0x00, self._screen_width-1])
+        self._cmd_data(CMD_SETROW, [0x00, self._screen_height-1])
+        self._cmd_data(CMD_STARTLINE, [0x80])
+        self._cmd_data(CMD_DISPLAYOFFSET, [self._screen_width])
+        self._cmd_data(CMD_PRECHARGE, [0x32])
+        self._cmd_data(CMD_VCOMH, [0x05])
         self._command(CMD_NORMALDISPLAY)
-        self._command(CMD_CONTRASTABC)
-        self._data(0x8A)
-        self._data(0x51)
-        self._data(0x8A)
-        self._command(CMD_CONTRASTMASTER)
-        self._data(0xCF)
-        self._command(CMD_SETVSL)
-        self._data(0xA0)
-        self._data(0xB5)
-        self._data(0x55)
-        self._command(CMD_PRECHARGE2)
-        self._data(0x01)
+        self._cmd_data(CMD_CONTRASTABC, [0x8A, 0x51, 0x8A])
+        self._cmd_data(CMD_CONTRASTMASTER, [0xCF])
+        self._cmd_data(CMD_SETVSL, [0xA0, 0xB5, 0x55])
+        self._cmd_data(CMD_PRECHARGE2, [0x01])
 
     def on(self):
         """
@@ -260,30 +299,28 @@ class SSD1351(spi.Spi):
         """
         self._command(DISPLAYOFF)
 
-    def _scale(self, x, inLow, inHigh, outLow, outHigh):
-        return int(((x - inLow) / float(inHigh) * outHigh) + outLow)
-
     def _encode_color(self, color):
-        red = (color >> 16) & 0xFF
-        green = (color >> 8) & 0xFF
-        blue = color & 0xFF
-        # scaled colors
-        redScaled = int(self._scale(red, 0, 0xFF, 0, 0x1F))
-        greenScaled = int(self._scale(green, 0, 0xFF, 0, 0x3F))
-        blueScaled = int(self._scale(blue, 0, 0xFF, 0, 0x1F))
-        return (((redScaled << 6) | greenScaled) << 5) | blueScaled
+        # 24 bit RGB truncated to 65k RGB565, see csrc/ssd1351.c
+        return _native_encode_color(color)
     
     def _set_font(self, font=None, font_color=None, encode=True):
         try:
             if font != None:
+                # the glyph natives read the font as a byte buffer
+                font = bytes(font)
                 self.font = font
+                self._char_width_cache = {}
                 self.first_char = font[2] | font[3] << 8
                 self.last_char = font[4] | font[5] << 8
                 self.font_height = font[6]
+                if font[0] == FONT_RLE:
+                    self._write_glyph = self._write_c_to_buf_rle
+                else:
+                    self._write_glyph = self._write_c_to_buf
             if font_color != None:
                 if encode:
                     font_color = self._encode_color(font_color)
-                self.font_color = font_color 
+                self.font_color = font_color
         except Exception as e:
             print("font not recognized:", e)
 
@@ -300,9 +337,13 @@ class SSD1351(spi.Spi):
 
     def _get_text_width(self, text):
         t_width = 0
+        widths = self._char_width_cache
         for c in text:
-            index = 8 + ((ord(c) - self.first_char) << 2)
-            t_width += self.font[index]
+            c_width = widths.get(c)
+            if c_width is None:
+                c_width = self.font[8 + ((ord(c) - self.first_char) << 2)]
+                widths[c] = c_width
+            t_width += c_width
             # insert 1 px for space
             t_width += 1
             #print(c, t_width)
@@ -311,103 +352,169 @@ class SSD1351(spi.Spi):
         #print(t_width)
         return t_width
 
-    def _add_text(self, text):
-        t_width = self._get_text_width(text)
-        if self.dynamic_area["width"]<t_width or self.dynamic_area["height"]<self.font_height:
+    def _add_text(self, text, t_width=None):
+        if t_width is None:
+            t_width = self._get_text_width(text)
+        # the buffered mode draws inside the (clipped) text box of the framebuffer, which can't grow
+        if not self._buffered and (self._da_w<t_width or self._da_h<self.font_height):
             #print("resize dynamic area")
-            self.dynamic_area["width"] = t_width
-            self.dynamic_area["height"]=self.font_height
-        y = (self.dynamic_area["height"] - self.font_height) >> 1
+            self._da_w = t_width
+            self._da_h=self.font_height
+        y = (self._da_h - self.font_height) >> 1
         #print("t_width",t_width)
-        if self.align == OLED_TEXT_ALIGN_LEFT:
-            x = 0
-        elif self.align == OLED_TEXT_ALIGN_RIGHT:
-            x = self.dynamic_area["width"] - t_width
-        elif self.align == OLED_TEXT_ALIGN_CENTER:
-            x = ((self.dynamic_area["width"] - t_width)//2)
-        elif self.align == OLED_TEXT_ALIGN_NONE:
-            x = 0
+        x = ((self._da_w - t_width)*OLED_TEXT_ALIGN_X.get(self.align, 1))//2
         #print("x", x, "y", y, t_width)
         # write the characters into designated space, one by one
         self._create_text_background()
+        if y < 0:
+            # text line taller than the box
+            return
+        w = self._da_w
+        row = self._da_offset + y*self._da_stride
+        write_glyph = self._write_glyph
         for c in text:
-            c_width = self._write_c_to_buf(c)
-            idx = ((y*self.dynamic_area["width"]*2) + x*2)#+OLED_COLUMN_OFFSET
-            self._add_char_to_dynamic_area(idx, c_width)
+            c_width = write_glyph(c)
+            if x >= 0 and x + c_width <= w:
+                self._add_char_to_dynamic_area(row + x*2, c_width)
             x += c_width + 1
             self.c_buf = None
 
     def _create_text_background(self):
-        d1 = self.background >> 8
-        d2 = self.background & 0x00FF
-        count = 0
-        area = self.dynamic_area["width"]*self.dynamic_area["height"]
-        self.dynamic_area["buffer"] = bytearray(area*2)
-        while count < area:
-            self.dynamic_area["buffer"][2*count] = d1
-            self.dynamic_area["buffer"][(2*count) + 1] = d2
-            count +=1
-
-    def _add_char_to_dynamic_area(self, idx, c_width, c_height):
-        x_count = 0
-        for b in self.c_buf:
-            self.dynamic_area["buffer"][idx] = b
-            x_count += 1
-            if x_count == c_width*2:
-                x_count = 0
-                idx += (self.dynamic_area["width"]-c_width)*2
-            idx += 1
+        if self._buffered:
+            self._da_buf = memoryview(self._fb)
+            self._fill_into(self._da_x, self._da_y, self._da_w, self._da_h, self.background)
+            return
+        w = self._da_w
+        area = w*self._da_h
+        if self._fb is None or area*2 > len(self._fb):
+            # grow the scratch buffer up to the largest text box drawn so far
+            self._fb = bytearray(area*2)
+        self._da_offset = 0
+        self._da_stride = w*2
+        _native_fill_buf(self._fb, 0, area, self.background)
+        self._da_buf = memoryview(self._fb)[0:area*2]
+
+    def _add_char_to_dynamic_area(self, idx, c_width):
+        # one slice copy per glyph row
+        dst = self._da_buf
+        stride = self._da_stride
+        row_bytes = c_width*2
+        src = memoryview(self.c_buf)
+        s = 0
+        for r in range(self.font_height):
+            dst[idx:idx+row_bytes] = src[s:s+row_bytes]
+            s += row_bytes
+            idx += stride
 
     def _write_c_to_buf(self, c):
-        #print(c)
+        font = self.font
+        height = self.font_height
         idx = 8 + ((ord(c) - self.first_char) << 2)
-        #print(idx, ord(c))
-        c_width = self.font[idx]
-        offset = self.font[idx+1] | (self.font[idx+2] << 8) | (self.font[idx+3] << 16)
-        #print(c_width, self.font_height, offset, len(self.font))
-        area = self.font_height*c_width
-        self.c_buf = bytearray(area*2)
-        cnt = 0
-        x_count = 0
-        while cnt < area:
-            if x_count == 0:
-                mask = 1
-                byte = self.font[offset]
-            #print(cnt, area, len(self.c_buf), byte)
-            if (byte & mask) != 0:
-                #print(((self.font_color >> 2) & 0xFF), (self.font_color & 0xFF))
-                self.c_buf[cnt*2] = self.font_color >> 8
-                self.c_buf[(cnt*2) + 1] = self.font_color & 0xFF
-            else:
-                self.c_buf[cnt*2] = self.background >> 8
-                self.c_buf[(cnt*2) + 1] = self.background & 0xFF
-            mask = mask << 1
-            cnt += 1
-            x_count += 1
-            if x_count == c_width:
-                x_count = 0
-                offset += 1
+        c_width = font[idx]
+        offset = font[idx+1] | (font[idx+2] << 8) | (font[idx+3] << 16)
+        c_buf = bytearray(height*c_width*2)
+        # rows of (c_width+7)//8 font bytes, expanded by csrc/ssd1351.c
+        _native_glyph_bits(c_buf, font, offset, c_width, height, self.font_color, self.background)
+        self.c_buf = c_buf
         return c_width
 
-    def _prepare(self, x, y, w, h):
-        # check border
-        if x >= self._screen_width or y >= self._screen_height:
+    def _write_c_to_buf_rle(self, c):
+        font = self.font
+        idx = 8 + ((ord(c) - self.first_char) << 2)
+        c_width = font[idx]
+        offset = font[idx+1] | (font[idx+2] << 8) | (font[idx+3] << 16)
+        count = self.font_height*c_width
+        c_buf = bytearray(count*2)
+        # a single stream of (font color, background) run pairs, expanded by csrc/ssd1351.c
+        _native_glyph_rle(c_buf, font, offset, count, self.font_color, self.background)
+        self.c_buf = c_buf
+        return c_width
+
+    def _blit_into(self, x, y, w, h, src, src_stride):
+        # copy a w*h pixels area of src, whose rows are src_stride bytes apart (0 to repeat the same row),
+        # into the framebuffer at x,y; clipped to the screen and marked dirty
+        rect = self._clip(x, y, w, h)
+        if rect is None:
+            return
+        cx, cy, cw, ch = rect
+        fb = memoryview(self._fb)
+        src = memoryview(src)
+        row = cw*2
+        stride = self._screen_width*2
+        s = (cy-y)*src_stride + (cx-x)*2
+        d = (cy*self._screen_width + cx)*2
+        for r in range(ch):
+            fb[d:d+row] = src[s:s+row]
+            s += src_stride
+            d += stride
+        self._mark_dirty(cx, cy, cw, ch)
+
+    def _fill_into(self, x, y, w, h, color):
+        # fill an area of the framebuffer repeating a single chunk row
+        _native_fill_buf(self._chunk_buf, 0, w, color)
+        self._blit_into(x, y, w, h, self._chunk_buf, 0)
+
+    def _clip(self, x, y, w, h):
+        # clip a rectangle to the screen, None if nothing is left
+        if x < 0:
+            w += x
+            x = 0
+        if y < 0:
+            h += y
+            y = 0
+        if x >= self._screen_width or y >= self._screen_height or w <= 0 or h <= 0:
             return None
-        if y+h > self._screen_height:
-            h = self._screen_height - y - 1
         if x+w > self._screen_width:
-            w = self._screen_width - x - 1
-        # adjust offset
-        x = x+self._column_offset
-        y = y+self._raw_offset
-        # set location
-        self._command(CMD_SETCOLUMN)
-        self._data(x)
-        self._data(x+w-1)
-        self._command(CMD_SETROW)
-        self._data(y)
-        self._data(y+h-1)
-        self._command(CMD_WRITERAM)
+            w = self._screen_width - x
+        if y+h > self._screen_height:
+            h = self._screen_height - y
+        return (x, y, w, h)
+
+    def _mark_dirty(self, x, y, w, h):
+        # flag the tiles covered by an already clipped rectangle
+        mask = self._dirty_mask
+        tiles_x = self._tiles_x
+        for ty in range(y//TILE_SIZE, (y+h-1)//TILE_SIZE + 1):
+            row = ty*tiles_x
+            for tx in range(x//TILE_SIZE, (x+w-1)//TILE_SIZE + 1):
+                mask[row+tx] = 1
+
+    def _make_prepare(self):
+        # window setup specialized for the screen set by init: its geometry is bound to default arguments
+        # so that the function, stored as self._prepare, reads no attribute but the spi ones
+        def _prepare(x, y, w, h, _sw=self._screen_width, _sh=self._screen_height,
+                     _co=self._column_offset, _ro=self._raw_offset):
+            # check border
+            if x >= _sw or y >= _sh:
+                return False
+            if y+h > _sh:
+                h = _sh - y - 1
+            if x+w > _sw:
+                w = _sw - x - 1
+            # adjust offset
+            x = x+_co
+            y = y+_ro
+            # set location and start writing the ram in a single chip select session,
+            # the caller sends the pixels and unselects
+            self.select()
+            self._win_cmd(CMD_SETCOLUMN, x, x+w-1)
+            self._win_cmd(CMD_SETROW, y, y+h-1)
+            digitalWrite(self.dc,0)
+            self.buf[0]=CMD_WRITERAM
+            self.write(self.buf)
+            digitalWrite(self.dc,1)
+            return True
+        return _prepare
+
+    def _win_cmd(self, cmd, start, end):
+        # address command with its two parameters, chip already selected
+        digitalWrite(self.dc,0)
+        self.buf[0]=cmd
+        self.write(self.buf)
+        digitalWrite(self.dc,1)
+        self._win_buf[0]=start
+        self._win_buf[1]=end
+        self.write(self._win_buf)
     
     def set_contrast(self, contrast=0x7F):
         """
@@ -421,15 +528,74 @@ class SSD1351(spi.Spi):
         """
         if contrast > 255:
             raise ValueError
-        self._command(CMD_CONTRASTMASTER)
-        self._data(contrast)
+        self._cmd_data(CMD_CONTRASTMASTER, [contrast])
     
-    def _send_data(self, bytes):
-        self.select()
-        digitalWrite(self.dc,1)
-        self.write(bytes)
+    def _window_and_send(self, x, y, w, h, bytes):
+        # window setup and pixels in the same chip select session
+        if not self._prepare(x, y, w, h):
+            return
+        n = len(bytes)
+        if n <= WRITE_SIZE:
+            self.write(bytes)
+        else:
+            data = memoryview(bytes)
+            for off in range(0, n, WRITE_SIZE):
+                self.write(data[off:off+WRITE_SIZE])
         self.unselect()
     
+    def flush(self):
+        """
+
+.. method:: flush()
+
+        Sends to the display the tiles of the framebuffer changed since the last flush.
+        Only meaningful in buffered mode, see :meth:`init`.
+
+        """
+        if not self._buffered:
+            return
+        fb = memoryview(self._fb)
+        tile = memoryview(self._chunk_buf)
+        mask = self._dirty_mask
+        tiles_x = self._tiles_x
+        sw = self._screen_width
+        sh = self._screen_height
+        stride = sw*2
+        for ty in range(self._tiles_y):
+            for tx in range(tiles_x):
+                i = ty*tiles_x + tx
+                if not mask[i]:
+                    continue
+                x = tx*TILE_SIZE
+                y = ty*TILE_SIZE
+                w = min(TILE_SIZE, sw - x)
+                h = min(TILE_SIZE, sh - y)
+                # gather the tile rows in a contiguous buffer
+                row = w*2
+                src = (y*sw + x)*2
+                dst = 0
+                for r in range(h):
+                    tile[dst:dst+row] = fb[src:src+row]
+                    src += stride
+                    dst += row
+                self._window_and_send(x, y, w, h, tile[0:dst])
+                mask[i] = 0
+
+    def swap(self):
+        """
+
+.. method:: swap()
+
+        Sends to the display the whole framebuffer in a single transfer, regardless of the changed tiles.
+        Only meaningful in buffered mode, see :meth:`init`.
+
+        """
+        if not self._buffered:
+            return
+        self._window_and_send(0, 0, self._screen_width, self._screen_height, self._fb)
+        for i in range(len(self._dirty_mask)):
+            self._dirty_mask[i] = 0
+
     def clear(self):
         """
 
@@ -476,21 +642,29 @@ class SSD1351(spi.Spi):
                   If a 16 bit color code is provided, the encode flag must be set to False.
 
         """
-        self._prepare(x, y, w, h)
         #print("not encoded", color)
         if encode:
             color = self._encode_color(color)
         #print("encoded", color)
-        d1 = color >> 8
-        d2 = color & 0x00FF
-        count = 0
-        self.s_buf = bytearray(w*h*2)
-        while count < w*h:
-            self.s_buf[2*count] = d1
-            self.s_buf[(2*count) + 1] = d2
-            count +=1
-        self._send_data(self.s_buf)
-        self.s_buf = None
+        if self._buffered:
+            rect = self._clip(x, y, w, h)
+            if rect is None:
+                return
+            x, y, w, h = rect
+            self._fill_into(x, y, w, h, color)
+            return
+        if not self._prepare(x, y, w, h):
+            return
+        # stream the area repeating the same chunk in the session opened by _prepare
+        chunk = self._chunk_buf
+        _native_fill_buf(chunk, 0, CHUNK_SIZE >> 1, color)
+        remaining = w*h*2
+        while remaining >= CHUNK_SIZE:
+            self.write(chunk)
+            remaining -= CHUNK_SIZE
+        if remaining:
+            self.write(memoryview(chunk)[0:remaining])
+        self.unselect()
         
     def draw_img(self, bytes, x, y, w, h):
         """
@@ -512,8 +686,10 @@ class SSD1351(spi.Spi):
                    Clicking on the "Get C string" button, the tool converts your image with your settings to a hex string that you can copy and paste inside a bytearray in your project and privide to this function.
 
         """
-        self._prepare(x, y, w, h)
-        self._send_data(bytes)
+        if self._buffered:
+            self._blit_into(x, y, w, h, bytes, w*2)
+            return
+        self._window_and_send(x, y, w, h, bytes)
         
     def draw_pixel(self, x, y, color, encode=True):
         """
@@ -532,12 +708,14 @@ class SSD1351(spi.Spi):
                   If a 16 bit color code is provided, the encode flag must be set to False.
 
         """
-        self._prepare(x, y, 1, 1)
         if encode:
             color = self._encode_color(color)
-        d1 = color >> 8
-        d2 = color & 0x00FF
-        self._send_data(bytearray([d1,d2]))
+        self._px_buf[0] = color >> 8
+        self._px_buf[1] = color & 0x00FF
+        if self._buffered:
+            self._blit_into(x, y, 1, 1, self._px_buf, 0)
+            return
+        self._window_and_send(x, y, 1, 1, self._px_buf)
         
     def draw_text(self, text, x=None, y=None, w=None, h=None, color=None, align=None, background=None, encode=True):
         """
@@ -573,7 +751,7 @@ class SSD1351(spi.Spi):
         """
         if not self.font_init:
             from solomon.ssd1351 import fonts
-            self._set_font(font=fonts.guiFont_Tahoma_7_Regular, font_color=0xFFFF, encode=False)
+            self._set_font(font=fonts.guiFont_Tahoma_7_Regular_RLE, font_color=0xFFFF, encode=False)
             self.font_init = True
         if color != None:
             self._set_font(font_color=color, encode=encode)
@@ -591,15 +769,26 @@ class SSD1351(spi.Spi):
             x = 0
         if y is None:
             y = 0
+        t_width = None
         if w is None:
-            w = self._get_text_width(text)
+            t_width = self._get_text_width(text)
+            w = t_width
         if h is None:
             h = self.font_height
-        self.dynamic_area["x"] = x
-        self.dynamic_area["y"] = y
-        self.dynamic_area["width"] = w
-        self.dynamic_area["height"] = h
-        self._add_text(text)
-        self._prepare(self.dynamic_area["x"], self.dynamic_area["y"], self.dynamic_area["width"], self.dynamic_area["height"])
-        self._send_data(self.dynamic_area["buffer"])
-        self.dynamic_area["buffer"] = None
+        if self._buffered:
+            rect = self._clip(x, y, w, h)
+            if rect is None:
+                return
+            x, y, w, h = rect
+            self._da_offset = (y*self._screen_width + x)*2
+            self._da_stride = self._screen_width*2
+        self._da_x = x
+        self._da_y = y
+        self._da_w = w
+        self._da_h = h
+        self._add_text(text, t_width)
+        if self._buffered:
+            self._da_buf = None
+            return
+        self._window_and_send(self._da_x, self._da_y, self._da_w, self._da_h, self._da_buf)
+        self._da_buf = None
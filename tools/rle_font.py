@@ -0,0 +1,95 @@
+"""
+Offline converter from the bitmap fonts of fonts.py to the run-length encoded format of the ssd1351 driver.
+
+Run it with a desktop Python from the library folder and append the output to fonts.py: ::
+
+    python tools/rle_font.py guiFont_Tahoma_7_Regular >> fonts.py
+
+The header and the character table keep the layout of the bitmap fonts (8 bytes of header, then 4 bytes per character
+with width and 24 bit data offset); the first header byte is set to the RLE marker.
+The pixels of each glyph are scanned row by row as a single stream and stored as one byte per run pair:
+high nibble is the length of a run of font color pixels, low nibble the length of the background run that follows.
+Runs longer than 15 pixels are split in more pairs.
+"""
+
+import os
+import sys
+
+FONT_RLE = 0x01
+
+
+def glyph_pixels(font, index):
+    first = font[2] | font[3] << 8
+    height = font[6]
+    idx = 8 + ((index - first) << 2)
+    width = font[idx]
+    offset = font[idx+1] | (font[idx+2] << 8) | (font[idx+3] << 16)
+    row_bytes = (width + 7) >> 3
+    pixels = []
+    for r in range(height):
+        for col in range(width):
+            pixels.append((font[offset + r*row_bytes + (col >> 3)] >> (col & 7)) & 1)
+    return width, pixels
+
+
+def encode_runs(pixels):
+    runs = []
+    i = 0
+    while i < len(pixels):
+        fg = 0
+        while i < len(pixels) and pixels[i] and fg < 15:
+            fg += 1
+            i += 1
+        bg = 0
+        # a full length fg run is closed by an empty bg run
+        while fg < 15 and i < len(pixels) and not pixels[i] and bg < 15:
+            bg += 1
+            i += 1
+        runs.append((fg << 4) | bg)
+    return runs
+
+
+def convert(font):
+    first = font[2] | font[3] << 8
+    last = font[4] | font[5] << 8
+    header = [FONT_RLE] + list(font[1:8])
+    table = []
+    glyphs = []
+    offset = 8 + 4*(last - first + 1)
+    for c in range(first, last + 1):
+        width, pixels = glyph_pixels(font, c)
+        runs = encode_runs(pixels)
+        table.append([width, offset & 0xFF, (offset >> 8) & 0xFF, (offset >> 16) & 0xFF])
+        glyphs.append((c, runs))
+        offset += len(runs)
+    return header, table, glyphs
+
+
+def hexs(values):
+    return ",".join("0x%02X" % v for v in values)
+
+
+def to_source(name, font):
+    header, table, glyphs = convert(font)
+    lines = [name + " = ["]
+    lines.append("   " + hexs(header[0:1]) + ",")
+    lines.append("   " + hexs(header[1:2]) + ",")
+    lines.append("   " + hexs(header[2:4]) + ",")
+    lines.append("   " + hexs(header[4:6]) + ",")
+    lines.append("   " + hexs(header[6:7]) + ",")
+    lines.append("   " + hexs(header[7:8]) + ",")
+    for entry in table:
+        lines.append("   " + hexs(entry) + ",")
+    for i, (c, runs) in enumerate(glyphs):
+        data = "   " + hexs(runs) + ("," if i < len(glyphs) - 1 else "")
+        lines.append(data.ljust(84) + "# Code for char num %d" % c)
+    lines.append("]")
+    return "\n".join(lines)
+
+
+if __name__ == "__main__":
+    sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+    import fonts
+    name = sys.argv[1] if len(sys.argv) > 1 else "guiFont_Tahoma_7_Regular"
+    print()
+    print(to_source(name + "_RLE", getattr(fonts, name)))